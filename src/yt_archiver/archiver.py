@@ -1,11 +1,19 @@
-import glob
+from concurrent.futures import ThreadPoolExecutor
 import os
 import re
-import scrapetube
+import shlex
 import subprocess
+import threading
+from .cache import VideoCache
 from .config import Config
 from .yt_api import YTApi
 
+# match: 'title [id].mpg', one file name per line
+_VIDEO_ID_RE = re.compile("^(.*\\[([\\w-]+)\\]\\.\\w+)$", re.MULTILINE)
+
+# match: 'title [id].en.vtt', 'title [id].mp4.part', etc., one file name per line
+_VIDEO_FILE_RE = re.compile("^(.*\\[([\\w-]+)\\].*)$", re.MULTILINE)
+
 
 class Archiver(object):
     """
@@ -16,6 +24,8 @@ class Archiver(object):
     preferences.
     """
 
+    VIDEO_URL = "https://youtu.be/"
+
     def __init__(self, config_file):
         """
         Initialize the Archiver with a given configuration file.
@@ -24,6 +34,18 @@ class Archiver(object):
             config_file (str): Path to the YAML or JSON configuration file.
         """
         self.config = Config(config_file)
+        self._print_lock = threading.Lock()
+        self.cache = VideoCache(ttl=self.config.cache_ttl(), log=self._print)
+
+    def _print(self, message):
+        """
+        Print a message without interleaving output from concurrent syncs.
+
+        Args:
+            message (str): Message to print.
+        """
+        with self._print_lock:
+            print(message)
 
     def channels(self):
         """
@@ -45,11 +67,7 @@ class Archiver(object):
         Yields:
             dict: Search result for each matching YouTube channel.
         """
-        for index, result in enumerate(YTApi.channel_search(term)):
-            if index + 1 == max_results:
-                break
-
-            yield result
+        yield from YTApi.channel_search(term, limit=max_results)
 
     def add_channel(self, channel):
         """
@@ -70,9 +88,27 @@ class Archiver(object):
         """
         Synchronize all configured channels by downloading new videos
         and cleaning up removed or outdated ones.
+
+        Channels are synced concurrently, bounded by the configured number
+        of sync workers. A failing channel is reported and does not stop the
+        others.
+
+        Returns:
+            bool: True if every channel synced successfully, False otherwise.
         """
-        for channel in self.config.channels():
-            self.sync_channel(channel)
+        channels = self.config.channels()
+        with ThreadPoolExecutor(max_workers=self.config.sync_workers()) as executor:
+            futures = [(channel, executor.submit(self.sync_channel, channel)) for channel in channels]
+
+        success = True
+        for channel, future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                self._print(f"Error syncing {channel.name}: {e}")
+                success = False
+
+        return success
 
     def sync_channel(self, channel):
         """
@@ -83,67 +119,90 @@ class Archiver(object):
 
         This involves downloading new videos and deleting those no longer in the latest list.
         """
+        self._print(f"Syncing channel: {channel.name}")
+
         local_videos = self.get_local_videos(channel)
         latest_videos = self.get_latest_videos(channel)
 
-        new_videos = latest_videos.difference(local_videos)
+        if local_videos.keys() == latest_videos:
+            return
+
+        new_videos = latest_videos - local_videos.keys()
         self.download_videos(channel, new_videos)
 
-        old_videos = local_videos.difference(latest_videos)
-        self.cleanup_videos(channel, old_videos)
+        old_videos = local_videos.keys() - latest_videos
+        if old_videos:
+            self.cleanup_videos(channel, {video: local_videos[video] for video in old_videos})
 
     def get_latest_videos(self, channel):
         """
         Get the latest video IDs from a YouTube channel.
 
+        Results are served from the cache while fresh. Otherwise the channel
+        is scraped newest first, stopping at the newest video of the previous
+        listing, if any.
+
         Args:
             channel (Channel): The channel to retrieve videos from.
 
         Returns:
             set: A set of video IDs.
         """
-        video_ids = set()
+        video_ids = self.cache.get(channel)
+        if video_ids is not None:
+            return video_ids
 
-        videos = scrapetube.get_channel(channel.id)
+        import scrapetube
 
-        for index, video in enumerate(videos):
-            video_ids.add(video["videoId"])
+        previous = self.cache.previous(channel)
+        head = previous[0] if previous else None
 
-            if index + 1 == channel.keep:
+        videos = scrapetube.get_channel(
+            channel.id, limit=channel.keep, sleep=self.config.scrape_delay()
+        )
+
+        latest = []
+        full = True
+        for video in videos:
+            if video["videoId"] == head:
+                latest = (latest + previous)[: channel.keep]
+                full = False
                 break
+            latest.append(video["videoId"])
 
-        return video_ids
+        self.cache.put(channel, latest, full=full)
+        return set(latest)
 
     def get_local_videos(self, channel):
         """
-        Get the set of locally downloaded video IDs for a channel.
+        Get the locally downloaded videos for a channel.
 
         Args:
             channel (Channel): The channel whose videos to check locally.
 
         Returns:
-            set: A set of video IDs present locally.
+            dict[str, list[str]]: Mapping of each local video ID to its file paths,
+                including sidecar files such as subtitles, metadata and partial downloads.
         """
-        video_ids = set()
+        video_ids = {}
 
         channel_path = os.path.join(self.config.output_path(), channel.name)
 
         try:
-            files = os.listdir(channel_path)
+            with os.scandir(channel_path) as entries:
+                names = "\n".join(
+                    entry.name for entry in entries if "\n" not in entry.name and entry.is_file()
+                )
         except Exception as e:
-            print(f"Error listing path '{channel_path}': {e}")
+            self._print(f"Error listing path '{channel_path}': {e}")
             return video_ids
 
-        # match: 'title [id].mpg'
-        video_pattern = re.compile("\\[([\\w-]+)\\]\\.\\w+$")
-
-        for file in files:
-            full_path = os.path.join(channel_path, file)
-            if os.path.isfile(full_path):
-                result = re.search(video_pattern, file)
+        for _, video_id in _VIDEO_ID_RE.findall(names):
+            video_ids[video_id] = []
 
-                if result:
-                    video_ids.add(result.group(1))
+        for name, video_id in _VIDEO_FILE_RE.findall(names):
+            if video_id in video_ids:
+                video_ids[video_id].append(os.path.join(channel_path, name))
 
         return video_ids
 
@@ -154,26 +213,121 @@ class Archiver(object):
         Args:
             channel (Channel): The channel for which to download videos.
             new_videos (set): Set of new video IDs to download.
+
+        If the downloader defines a `batch_command`, all videos are passed to a
+        single invocation in place of its `{video_ids}` argument. Otherwise
+        one download is run per video, concurrently, bounded by the
+        downloader's `parallel` setting (defaults to 4). Each download runs the
+        `argv` argument list directly if defined, falling back to running
+        `command` through the shell.
         """
+        if not new_videos:
+            return
+
         downloader = self.config.downloader()
+
+        if "batch_command" in downloader:
+            self.batch_download_videos(channel, new_videos)
+            return
+
+        use_shell = "argv" not in downloader
+
+        kwargs = downloader | {"channel_name": channel.name}
+
+        commands = {}
         for video in new_videos:
-            kwargs = downloader | {"video_id": video, "channel_name": channel.name}
-            subprocess.call(downloader["command"].format(**kwargs), shell=True)
+            kwargs["video_id"] = video
+            if use_shell:
+                commands[video] = downloader["command"].format(**kwargs)
+            else:
+                commands[video] = [arg.format(**kwargs) for arg in downloader["argv"]]
+
+        with ThreadPoolExecutor(max_workers=downloader.get("parallel", 4)) as executor:
+            futures = {
+                video: executor.submit(subprocess.call, cmd, shell=use_shell)
+                for video, cmd in commands.items()
+            }
+
+        for video, future in futures.items():
+            try:
+                status = future.result()
+            except Exception as e:
+                self._print(f"Error downloading {video}: {e}")
+                continue
+
+            if status != 0:
+                self._print(f"Error downloading {video}: downloader exited with status {status}")
+
+    def batch_download_videos(self, channel, new_videos):
+        """
+        Download new videos for a channel with a single downloader invocation.
 
-    def cleanup_videos(self, channel, patterns):
+        Args:
+            channel (Channel): The channel for which to download videos.
+            new_videos (set): Set of new video IDs to download.
+
+        The downloader's `batch_command` is split into arguments before being
+        formatted, so values containing spaces stay a single argument and no
+        shell is involved. An argument of exactly `{video_ids}` expands to one
+        argument per video; precede it with `--` so IDs starting with a dash
+        are not taken as options. Without a `{video_ids}` argument, video URLs
+        are written to the command's stdin one per line (e.g. `yt-dlp -a -`).
+        A `{video_ids}` placeholder within a larger argument is reported as
+        an error and nothing is downloaded.
+        """
+        downloader = self.config.downloader()
+        kwargs = downloader | {"channel_name": channel.name}
+
+        argv = []
+        use_stdin = True
+        for arg in shlex.split(downloader["batch_command"]):
+            if arg == "{video_ids}":
+                argv.extend(sorted(new_videos))
+                use_stdin = False
+            elif "{video_ids}" in arg:
+                self._print(
+                    f"Error downloading videos for {channel.name}: batch_command argument "
+                    f"'{arg}' is invalid, {{video_ids}} must be a separate argument"
+                )
+                return
+            else:
+                argv.append(arg.format(**kwargs))
+
+        try:
+            if use_stdin:
+                urls = "".join(f"{self.VIDEO_URL}{video}\n" for video in sorted(new_videos))
+                with subprocess.Popen(argv, stdin=subprocess.PIPE, text=True) as proc:
+                    proc.communicate(urls)
+                status = proc.returncode
+            else:
+                status = subprocess.call(argv)
+        except OSError as e:
+            self._print(f"Error downloading videos for {channel.name}: {e}")
+            return
+
+        if status != 0:
+            self._print(
+                f"Error downloading videos for {channel.name}: "
+                f"downloader exited with status {status}"
+            )
+
+    def cleanup_videos(self, channel, old_videos):
         """
         Delete local video files that are no longer part of the latest set.
 
         Args:
             channel (Channel): The channel to clean up.
-            patterns (set): Set of video ID substrings to match for deletion.
+            old_videos (dict[str, list[str]]): Mapping of stale video IDs to their file paths,
+                as returned by `get_local_videos`.
         """
-        output_path = self.config.downloader().get("output_path")
-        for pattern in patterns:
-            match_path = os.path.join(output_path, channel.name, f"*{pattern}*")
-            for file_path in glob.glob(match_path):
+        messages = []
+        for paths in old_videos.values():
+            for file_path in paths:
                 try:
                     os.unlink(file_path)
-                    print(f"Deleted: {file_path}")
+                    messages.append(f"Deleted: {file_path}")
                 except Exception as e:
-                    print(f"Error deleting {file_path}: {e}")
+                    messages.append(f"Error deleting {file_path}: {e}")
+
+        if messages:
+            self._print("\n".join(messages))
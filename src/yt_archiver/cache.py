@@ -0,0 +1,171 @@
+import json
+import math
+import os
+import random
+import threading
+import time
+
+
+class VideoCache(object):
+    """
+    Time-limited cache of the latest video IDs for each channel.
+
+    Entries are kept in memory and persisted as JSON files so that repeated
+    `sync` runs within `ttl` seconds avoid re-scraping YouTube, at the cost of
+    not seeing uploads made in the meantime. Entries are refreshed
+    probabilistically as they approach expiry to avoid every caller
+    refreshing at once.
+
+    Expired entries remain available as the previous listing, newest video
+    first, so that a refresh only needs to scrape videos newer than the
+    previous head. A full listing is required once `full_refresh` seconds
+    have passed, so that videos removed from the channel are noticed.
+
+    Attributes:
+        path (str): Directory holding the cache files.
+        ttl (int): Number of seconds an entry stays valid.
+        full_refresh (int): Number of seconds a full listing can be extended incrementally.
+    """
+
+    DEFAULT_PATH = "~/.cache/yt-archiver"
+
+    def __init__(self, path=DEFAULT_PATH, ttl=0, full_refresh=86400, log=print):
+        """
+        Initialize the cache.
+
+        Args:
+            path (str): Directory holding the cache files (can include ~ for home).
+            ttl (int): Number of seconds an entry stays valid. Defaults to 0, so
+                entries are only used as the previous listing.
+            full_refresh (int): Number of seconds a full listing can be extended
+                incrementally. Defaults to one day.
+            log (callable): Called with error messages. Defaults to `print`.
+        """
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.full_refresh = full_refresh
+        self._log = log
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _file(self, channel):
+        """
+        Get the cache file path for a channel.
+
+        Args:
+            channel (Channel): The channel whose cache file to locate.
+
+        Returns:
+            str: Path to the channel's cache file.
+        """
+        return os.path.join(self.path, f"latest_{channel.id}.json")
+
+    def _is_fresh(self, entry):
+        """
+        Decide whether a cache entry can still be served.
+
+        Entries are refreshed early with a probability that grows as the
+        expiry time approaches.
+
+        Args:
+            entry (dict): A cache entry with `expiry` and `beta` fields.
+
+        Returns:
+            bool: True if the entry should be used, False if it should be refreshed.
+        """
+        now = time.time()
+        if now >= entry["expiry"]:
+            return False
+        return random.random() >= math.exp((now - entry["expiry"]) / entry["beta"])
+
+    def _load(self, channel):
+        """
+        Load the cache entry for a channel, regardless of its age.
+
+        Args:
+            channel (Channel): The channel to look up.
+
+        Returns:
+            dict or None: The cache entry, or None if missing or for a different `keep`.
+        """
+        with self._lock:
+            entry = self._entries.get(channel.id)
+
+        if entry is None:
+            try:
+                with open(self._file(channel), "r") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+
+            with self._lock:
+                self._entries[channel.id] = entry
+
+        if entry.get("keep") != channel.keep or "refreshed" not in entry:
+            return None
+
+        return entry
+
+    def get(self, channel):
+        """
+        Get the cached latest video IDs for a channel.
+
+        Args:
+            channel (Channel): The channel to look up.
+
+        Returns:
+            set or None: The cached video IDs, or None if missing or stale.
+        """
+        entry = self._load(channel)
+        if entry is None or not self._is_fresh(entry):
+            return None
+        return set(entry["videos"])
+
+    def previous(self, channel):
+        """
+        Get the previous latest videos for a channel, even if stale.
+
+        Args:
+            channel (Channel): The channel to look up.
+
+        Returns:
+            list or None: Video IDs newest first, or None if a full listing is required.
+        """
+        entry = self._load(channel)
+        if entry is None or time.time() - entry["refreshed"] >= self.full_refresh:
+            return None
+        return entry["videos"]
+
+    def put(self, channel, video_ids, full=True):
+        """
+        Store the latest video IDs for a channel.
+
+        Args:
+            channel (Channel): The channel the videos belong to.
+            video_ids (list): The latest video IDs, newest first.
+            full (bool): True if `video_ids` came from a full listing rather than
+                extending the previous one.
+        """
+        now = time.time()
+        refreshed = now
+        if not full:
+            previous = self._load(channel)
+            refreshed = previous["refreshed"] if previous else 0
+
+        entry = {
+            "keep": channel.keep,
+            "videos": list(video_ids),
+            "expiry": now + self.ttl,
+            "beta": max(self.ttl / 10, 1),
+            "refreshed": refreshed,
+        }
+
+        with self._lock:
+            self._entries[channel.id] = entry
+
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(self._file(channel), "w") as f:
+                json.dump(entry, f)
+        except OSError as e:
+            self._log(f"Error writing cache for '{channel.id}': {e}")
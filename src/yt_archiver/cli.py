@@ -1,6 +1,5 @@
 import argparse
-from rich.console import Console
-from rich.table import Table
+from concurrent.futures import ThreadPoolExecutor
 from yt_archiver.archiver import Archiver
 from yt_archiver.config import Config
 
@@ -45,8 +44,22 @@ class ArchiverCLI(object):
         Args:
             config (str): Path to the configuration file.
         """
-        self.console = Console()
         self.archiver = Archiver(config)
+        self._console = None
+
+    @property
+    def console(self):
+        """
+        Get the Rich console used for table output, creating it on first use.
+
+        Returns:
+            rich.console.Console: The console.
+        """
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
 
     def search(self, term):
         """
@@ -58,6 +71,8 @@ class ArchiverCLI(object):
         Returns:
             int: Exit status code (0).
         """
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold blue")
 
         table.add_column("Channel")
@@ -87,16 +102,25 @@ class ArchiverCLI(object):
         """
         Display the current download status of all configured channels.
 
+        Local directories are scanned concurrently, which helps on
+        high-latency filesystems.
+
         Returns:
             int: Exit status code (0).
         """
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold blue")
 
         table.add_column("Channel")
         table.add_column("Downloads", justify="right")
 
-        for channel in self.archiver.channels():
-            downloads = str(len(self.archiver.get_local_videos(channel)))
+        channels = self.archiver.channels()
+        with ThreadPoolExecutor(max_workers=self.archiver.config.status_workers()) as executor:
+            local_videos = executor.map(self.archiver.get_local_videos, channels)
+
+        for channel, videos in zip(channels, local_videos):
+            downloads = str(len(videos))
             downloads += f"/{channel.keep}" if channel.keep else ""
             table.add_row(channel.name, downloads)
 
@@ -108,12 +132,9 @@ class ArchiverCLI(object):
         Sync all channels by downloading new videos and cleaning up old ones.
 
         Returns:
-            int: Exit status code (0).
+            int: 0 if every channel synced, 1 if any channel failed.
         """
-        for channel in self.archiver.channels():
-            print(f"Syncing channel: {channel.name}")
-            self.archiver.sync_channel(channel)
-        return 0
+        return 0 if self.archiver.sync() else 1
 
 
 def main():
@@ -2,6 +2,11 @@ from collections import namedtuple
 import os
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
 
 class Config(object):
     """
@@ -28,8 +33,11 @@ class Config(object):
         """
         path = os.path.expanduser(path)
         with open(path, "r") as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=_Loader)
         self.path = path
+        self.config["channels"] = self.config.get("channels") or []
+        self._channels_by_id = {c["id"]: c for c in self.config["channels"]}
+        self._channels = None
 
     def save(self, path=None):
         """
@@ -42,7 +50,7 @@ class Config(object):
             path = self.path
         path = os.path.expanduser(path)
         with open(path, "w") as f:
-            yaml.dump(self.config, f, sort_keys=False)
+            yaml.dump(self.config, f, Dumper=_Dumper, sort_keys=False)
 
     def channels(self):
         """
@@ -51,7 +59,9 @@ class Config(object):
         Returns:
             list[Channel]: A list of Channel namedtuples defined in the config.
         """
-        return [self.Channel(**c) for c in self.config.get("channels", [])]
+        if self._channels is None:
+            self._channels = [self.Channel(**c) for c in self.config["channels"]]
+        return self._channels
 
     def add_channel(self, new_channel):
         """
@@ -63,16 +73,17 @@ class Config(object):
         Returns:
             bool: True if the channel was added successfully, False if it already exists.
         """
-        for channel in self.channels():
-            if channel.id == new_channel.id:
-                print(f"Channel ID '{channel.id}' already in archive")
-                return False
+        if new_channel.id in self._channels_by_id:
+            print(f"Channel ID '{new_channel.id}' already in archive")
+            return False
 
         kwargs = new_channel._asdict()
         if kwargs["keep"] is None:
             del kwargs["keep"]
 
-        self.config.get("channels", []).append(kwargs)
+        self._channels_by_id[new_channel.id] = kwargs
+        self.config["channels"].append(kwargs)
+        self._channels = None
         return True
 
     def downloader(self):
@@ -84,6 +95,42 @@ class Config(object):
         """
         return self.config.get("downloader", None)
 
+    def sync_workers(self):
+        """
+        Get the maximum number of channels to sync concurrently.
+
+        Returns:
+            int: The configured number of sync workers, defaulting to 8.
+        """
+        return self.config.get("sync_workers", 8)
+
+    def status_workers(self):
+        """
+        Get the maximum number of channel directories to scan concurrently for status.
+
+        Returns:
+            int: The configured number of status workers, defaulting to 16.
+        """
+        return self.config.get("status_workers", 16)
+
+    def cache_ttl(self):
+        """
+        Get the number of seconds cached channel listings stay valid.
+
+        Returns:
+            int: The configured cache TTL, defaulting to 0 (caching disabled).
+        """
+        return self.config.get("cache_ttl", 0)
+
+    def scrape_delay(self):
+        """
+        Get the delay between channel listing page requests.
+
+        Returns:
+            float: Seconds to wait between page requests, defaulting to 1.
+        """
+        return self.config.get("scrape_delay", 1)
+
     def output_path(self):
         """
         Get the output path for downloads from the downloader config.
@@ -1,57 +1,45 @@
 from collections import namedtuple
-from glom import glom
-import scrapetube
 from urllib.parse import urljoin
 
 
 class YTApi(object):
     """
     Provides utility methods for extracting YouTube channel information
-    from search results using the Scrapetube and Glom libraries.
+    from Scrapetube search results.
     """
 
     CHANNEL_TYPE = "WEB_PAGE_TYPE_CHANNEL"
 
     BASE_URL = "https://www.youtube.com/"
 
-    PAGE_TYPE_PATH = ".".join(
-        [
-            "longBylineText",
-            "runs",
-            "0",
-            "navigationEndpoint",
-            "commandMetadata",
-            "webCommandMetadata",
-            "webPageType",
-        ]
-    )
-
-    CHANNEL_ID_PATH = ".".join(
-        [
-            "longBylineText",
-            "runs",
-            "0",
-            "navigationEndpoint",
-            "browseEndpoint",
-            "browseId",
-        ]
-    )
-
-    CHANNEL_NAME_PATH = ".".join(["longBylineText", "runs", "0", "text"])
-
-    CHANNEL_URL_PATH = ".".join(
-        [
-            "longBylineText",
-            "runs",
-            "0",
-            "navigationEndpoint",
-            "browseEndpoint",
-            "canonicalBaseUrl",
-        ]
-    )
-
     SearchResult = namedtuple("SearchResult", "id name url")
 
+    @staticmethod
+    def _extract(search_result):
+        """
+        Walk a search result once and extract its channel fields.
+
+        Args:
+            search_result (dict): A single search result from scrapetube.
+
+        Returns:
+            tuple: The page type, channel ID, channel name and relative channel URL,
+                each None if not found.
+        """
+        try:
+            run = search_result["longBylineText"]["runs"][0]
+            nav = run.get("navigationEndpoint", {})
+            web = nav.get("commandMetadata", {}).get("webCommandMetadata", {})
+            browse = nav.get("browseEndpoint", {})
+            return (
+                web.get("webPageType"),
+                browse.get("browseId"),
+                run.get("text"),
+                browse.get("canonicalBaseUrl"),
+            )
+        except (KeyError, IndexError, TypeError, AttributeError):
+            return (None,) * 4
+
     @staticmethod
     def is_channel(search_result):
         """
@@ -63,8 +51,7 @@ class YTApi(object):
         Returns:
             bool: True if the result is a channel, False otherwise.
         """
-        page_type = glom(search_result, YTApi.PAGE_TYPE_PATH, default=None)
-        return page_type == YTApi.CHANNEL_TYPE
+        return YTApi._extract(search_result)[0] == YTApi.CHANNEL_TYPE
 
     @staticmethod
     def channel_id(search_result):
@@ -77,7 +64,7 @@ class YTApi(object):
         Returns:
             str or None: Channel ID if found, else None.
         """
-        return glom(search_result, YTApi.CHANNEL_ID_PATH, default=None)
+        return YTApi._extract(search_result)[1]
 
     @staticmethod
     def channel_name(search_result):
@@ -90,7 +77,7 @@ class YTApi(object):
         Returns:
             str or None: Channel name if found, else None.
         """
-        return glom(search_result, YTApi.CHANNEL_NAME_PATH, default=None)
+        return YTApi._extract(search_result)[2]
 
     @staticmethod
     def channel_url(search_result):
@@ -103,25 +90,31 @@ class YTApi(object):
         Returns:
             str or None: Full channel URL if found, else None.
         """
-        channel_url = glom(search_result, YTApi.CHANNEL_URL_PATH, default=None)
-        return urljoin(YTApi.BASE_URL, channel_url)
+        return urljoin(YTApi.BASE_URL, YTApi._extract(search_result)[3])
 
     @staticmethod
-    def channel_search(term):
+    def channel_search(term, limit=None):
         """
         Perform a search on YouTube using the given term and yield unique channel results.
 
         Args:
             term (str): Search term to query YouTube.
+            limit (int, optional): Stop searching once this many channels have been yielded.
 
         Yields:
             SearchResult: A named tuple containing the channel ID, name, and URL.
         """
+        if limit is not None and limit <= 0:
+            return
+
+        import scrapetube
+
         result_ids = set()
         for result in scrapetube.get_search(term):
-            id_ = YTApi.channel_id(result)
-            if YTApi.is_channel(result) and id_ not in result_ids:
+            page_type, id_, name, url = YTApi._extract(result)
+            if page_type == YTApi.CHANNEL_TYPE and id_ not in result_ids:
                 result_ids.add(id_)
-                name = YTApi.channel_name(result)
-                url = YTApi.channel_url(result)
-                yield YTApi.SearchResult(id=id_, name=name, url=url)
+                yield YTApi.SearchResult(id=id_, name=name, url=urljoin(YTApi.BASE_URL, url))
+
+                if len(result_ids) == limit:
+                    break